@@ -1,31 +1,136 @@
 import csv
 import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger()
 
-# Function to check for food stall (plateau) conditions
-def is_food_stall(temp):
-    """Return True if the temperature is within the food stall range (150°F to 170°F)."""
-    return 150 <= temp <= 190
+# Food stall (plateau) temperature range in °F
+STALL_MIN_TEMP = 150.0
+STALL_MAX_TEMP = 190.0
+
+# Files smaller than this are processed in a single chunk without worker processes
+MIN_PARALLEL_FILE_SIZE = 1 << 20  # 1 MiB
+
+# Function to read the header and find newline-aligned chunk boundaries
+def split_csv(file_path, num_chunks):
+    """Return (header column names, [(start, end), ...]) for the CSV body."""
+    with open(file_path, mode='rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            header_end = mm.find(b'\n')
+            if header_end == -1:
+                header_end = size
+            # Parse the header with csv so quoted column names are handled
+            header = next(csv.reader([mm[:header_end].decode('utf-8').strip()]), [])
+            for column in ('time', 'temperature'):
+                if column not in header:
+                    raise ValueError(f"Missing '{column}' column in CSV header: {header}")
+
+            # Start each chunk just after the first newline at or past its nominal offset
+            body_start = min(header_end + 1, size)
+            chunk_size = max((size - body_start) // num_chunks, 1)
+            boundaries = [body_start]
+            for i in range(1, num_chunks):
+                nl = mm.find(b'\n', max(body_start + i * chunk_size, boundaries[-1]))
+                if nl == -1:
+                    break
+                boundaries.append(nl + 1)
+            boundaries.append(size)
+
+    chunks = [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+    return header, chunks
+
+# Function to find stall state transitions in one chunk of the CSV
+def process_chunk(file_path, start, end, header):
+    """Return the stall state transition events for the rows in bytes [start, end).
+
+    The first row of the chunk is always reported; the caller drops it if the
+    previous chunk ended in the same state.
+    """
+    # Parse the chunk straight from the memory map into Arrow columns (SoA)
+    with pa.memory_map(file_path) as source:
+        table = pacsv.read_csv(
+            pa.BufferReader(source.read_at(end - start, start)),
+            read_options=pacsv.ReadOptions(column_names=header),
+            convert_options=pacsv.ConvertOptions(
+                column_types={'time': pa.string(), 'temperature': pa.float32()},
+                include_columns=['time', 'temperature'],
+            ),
+        )
+
+    if table.num_rows == 0:
+        return []
+
+    # Missing temperatures would become NaN and silently read as "no stall"
+    temperature = table.column('temperature')
+    if temperature.null_count:
+        raise ValueError(
+            f"{temperature.null_count} row(s) with a missing temperature in bytes {start}-{end} of {file_path}"
+        )
+
+    # Times stay in Arrow and are only converted for the transition rows
+    times = table.column('time')
+    temps = temperature.to_numpy()
+
+    # Check every temperature against the stall range in one vectorized pass
+    stall = (temps >= STALL_MIN_TEMP) & (temps <= STALL_MAX_TEMP)
+
+    # Rows where the stall state changes from the previous row
+    changes = np.flatnonzero(np.diff(stall.view(np.int8))) + 1
+    transitions = np.concatenate(([0], changes))
+
+    return [(times[int(i)].as_py(), temps[i], bool(stall[i])) for i in transitions]
 
 # Function to consume the CSV and monitor the food temperature
-def consume_csv(file_path):
+def consume_csv(file_path, max_workers=None):
     """Process a CSV file to detect the food stall conditions."""
-    with open(file_path, mode='r') as file:
-        csv_reader = csv.DictReader(file)
-        
-        # Loop through each row (time, temperature)
-        for row in csv_reader:
-            time = row['time']
-            temperature = float(row['temperature'])
-            
-            # Log and check if the temperature is within the stall range
-            if is_food_stall(temperature):
-                logger.info(f"Time {time}: Food temperature is in stall range ({temperature}°F). Adjusting cooking settings.")
+    # An empty file cannot be memory-mapped and has no rows to check
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        return
+
+    if file_size < MIN_PARALLEL_FILE_SIZE:
+        num_chunks = 1
+    else:
+        num_chunks = max_workers or os.cpu_count() or 1
+
+    header, chunks = split_csv(file_path, num_chunks)
+
+    if len(chunks) <= 1:
+        results = [process_chunk(file_path, start, end, header) for start, end in chunks]
+    else:
+        # Rows are independent, so check each chunk in its own process
+        with ProcessPoolExecutor(max_workers=num_chunks) as executor:
+            futures = [
+                executor.submit(process_chunk, file_path, start, end, header)
+                for start, end in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    # Nothing to report if INFO records would be dropped anyway
+    # (parsing and validation above still run)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    # Merge chunk results in file order, only logging real state changes
+    prev_state = None
+    for events in results:
+        for time, temperature, state in events:
+            if state == prev_state:
+                continue
+            prev_state = state
+            if state:
+                logger.info("Time %s: Food temperature is in stall range (%s°F). Adjusting cooking settings.", time, temperature)
             else:
-                logger.info(f"Time {time}: Food temperature is {temperature}°F, no stall detected.")
+                logger.info("Time %s: Food temperature is %s°F, no stall detected.", time, temperature)
 
 # Main entry point to run the consumer
 if __name__ == "__main__":
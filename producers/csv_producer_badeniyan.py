@@ -94,18 +94,29 @@ def generate_messages(file_path: pathlib.Path):
             with open(DATA_FILE, "r") as csv_file:
                 logger.info(f"Reading data from file: {DATA_FILE}")
 
-                csv_reader = csv.DictReader(csv_file)
+                # Use positional rows rather than allocating a dict per row
+                csv_reader = csv.reader(csv_file)
+                header = next(csv_reader, [])
+
+                # Ensure required fields are present
+                if "temperature" not in header:
+                    logger.error(f"Missing 'temperature' column in header: {header}. Exiting.")
+                    sys.exit(2)
+                temperature_index = header.index("temperature")
+
                 for row in csv_reader:
-                    # Ensure required fields are present
-                    if "temperature" not in row:
-                        logger.error(f"Missing 'temperature' column in row: {row}")
+                    # Skip blank lines, as csv.DictReader did
+                    if not row:
+                        continue
+                    if len(row) <= temperature_index:
+                        logger.error(f"Missing 'temperature' value in row: {row}")
                         continue
 
                     # Generate a timestamp and prepare the message
                     current_timestamp = datetime.utcnow().isoformat()
                     message = {
                         "timestamp": current_timestamp,
-                        "temperature": float(row["temperature"]),
+                        "temperature": float(row[temperature_index]),
                     }
                     logger.debug(f"Generated message: {message}")
                     yield message
@@ -18,19 +18,24 @@ Example serialized to Kafka message:
 import os
 import sys
 import time
+import itertools  # cycle through the parsed entries
 import pathlib  # work with file paths
 import json  # work with JSON data
 
 # Import external packages
+import fastjsonschema  # compiled JSON schema validation
+import ijson  # stream-parse large JSON files
+import orjson  # fast JSON serialization (returns bytes)
 from dotenv import load_dotenv
 
 # Import functions from local modules
 from utils.utils_producer import (
+    RAW_BYTES,
     verify_services,
     create_kafka_producer,
     create_kafka_topic,
 )
-from utils.utils_logger import logger
+from utils.utils_logger import enable_queued_logging, logger
 
 #####################################
 # Load Environment Variables
@@ -38,6 +43,14 @@ from utils.utils_logger import logger
 
 load_dotenv()
 
+#####################################
+# Configure Logging
+#####################################
+
+# Hand log records to a background writer thread; the queue absorbs short
+# bursts but blocks the send loop once full. The console shows INFO and above.
+enable_queued_logging(console_level="INFO")
+
 #####################################
 # Getter Functions for .env Variables
 #####################################
@@ -45,14 +58,14 @@ load_dotenv()
 def get_kafka_topic() -> str:
     """Fetch Kafka topic from environment or use default."""
     topic = os.getenv("BUZZ_TOPIC", "unknown_topic")
-    logger.info(f"Kafka topic: {topic}")
+    logger.info("Kafka topic: {}", topic)
     return topic
 
 
-def get_message_interval() -> int:
-    """Fetch message interval from environment or use default."""
-    interval = int(os.getenv("BUZZ_INTERVAL_SECONDS", 1))
-    logger.info(f"Message interval: {interval} seconds")
+def get_message_interval() -> float:
+    """Fetch message interval from environment or use default (may be fractional)."""
+    interval = float(os.getenv("BUZZ_INTERVAL_SECONDS", 1))
+    logger.info("Message interval: {} seconds", interval)
     return interval
 
 
@@ -82,74 +95,98 @@ def get_custom_message() -> dict:
 
 # The parent directory of this file is its folder.
 # Go up one more parent level to get the project root.
-PROJECT_ROOT = pathlib.Path(__file__).parent.parent
-logger.info(f"Project root: {PROJECT_ROOT}")
+# Resolve once at import time and keep the data file as a plain string.
+PROJECT_ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent
+DATA_FOLDER: pathlib.Path = PROJECT_ROOT / "data"
+DATA_FILE: str = os.fspath(DATA_FOLDER / "buzz.json")
+
+# Path details are only useful when debugging
+logger.debug("Project root: {}", PROJECT_ROOT)
+logger.debug("Data folder: {}", DATA_FOLDER)
+logger.debug("Data file: {}", DATA_FILE)
 
-# Set directory where data is stored
-DATA_FOLDER: pathlib.Path = PROJECT_ROOT.joinpath("data")
-logger.info(f"Data folder: {DATA_FOLDER}")
+#####################################
+# Producer Batching Settings
+#####################################
+
+# Wait briefly so the client can group records into larger batches
+PRODUCER_LINGER_MS: int = 20
+PRODUCER_BATCH_SIZE: int = 65536
+PRODUCER_COMPRESSION_TYPE: str = "lz4"
+PRODUCER_ACKS: int = 1
+
+#####################################
+# Message Validation
+#####################################
 
-# Set the name of the data file
-DATA_FILE: pathlib.Path = DATA_FOLDER.joinpath("buzz.json")
-logger.info(f"Data file: {DATA_FILE}")
+# Compile the buzz entry schema once at import time
+validate_buzz_entry = fastjsonschema.compile({"type": "object"})
 
 #####################################
 # Message Generators
 #####################################
 
-def generate_messages(file_path: pathlib.Path):
+def generate_messages(file_path: str):
     """
-    Read from a JSON file and yield messages one by one, continuously.
+    Stream a JSON file once and yield its messages one by one, continuously.
+
+    The first pass yields entries as they are parsed, so production starts
+    before the whole file is read. Each entry is validated and serialized
+    once, and later passes replay the cached payloads without re-checking.
 
     Args:
-        file_path (pathlib.Path): Path to the JSON file.
+        file_path (str): Path to the JSON file.
 
     Yields:
-        dict: A dictionary containing the JSON data.
+        bytes: One JSON entry serialized as UTF-8 encoded JSON.
     """
-    while True:
-        try:
-            logger.info(f"Opening data file in read mode: {file_path}")
-            with open(file_path, "r") as json_file:
-                logger.info(f"Reading data from file: {file_path}")
-
-                # Load the JSON file as a list of dictionaries
-                json_data: list = json.load(json_file)
-
-                if not isinstance(json_data, list):
-                    raise ValueError(
-                        f"Expected a list of JSON objects, got {type(json_data)}."
-                    )
-
-                # Iterate over the entries in the JSON file
-                for buzz_entry in json_data:
-                    logger.debug(f"Generated JSON from file: {buzz_entry}")
-                    yield buzz_entry
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}. Exiting.")
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON format in file: {file_path}. Error: {e}")
-            sys.exit(2)
-        except Exception as e:
-            logger.error(f"Unexpected error in message generation: {e}")
-            sys.exit(3)
+    buzz_payloads: list = []
+    try:
+        logger.info("Opening data file in read mode: {}", file_path)
+        with open(file_path, "rb") as json_file:
+            logger.info("Reading data from file: {}", file_path)
+
+            # Stream each element of the top-level JSON array
+            for buzz_entry in ijson.items(json_file, "item", use_float=True):
+                validate_buzz_entry(buzz_entry)
+                payload: bytes = orjson.dumps(buzz_entry)
+                buzz_payloads.append(payload)
+                logger.debug("Generated JSON from file: {}", buzz_entry)
+                yield payload
+
+        if not buzz_payloads:
+            raise ValueError("Expected a non-empty list of JSON objects.")
+    except FileNotFoundError:
+        logger.error("File not found: {}. Exiting.", file_path)
+        sys.exit(1)
+    except (ijson.JSONError, ValueError) as e:
+        logger.error("Invalid JSON format in file: {}. Error: {}", file_path, e)
+        sys.exit(2)
+    except Exception as e:
+        logger.error("Unexpected error in message generation: {}", e)
+        sys.exit(3)
+
+    # The data file is static, so replay the serialized entries forever
+    # (each entry was already logged when it was first parsed)
+    yield from itertools.cycle(buzz_payloads)
 
 
 def generate_custom_message(custom_msg: dict):
     """
-    Continuously yield the same custom message.
+    Continuously yield the same custom message, serialized once.
     
     Args:
         custom_msg (dict): The custom message to send.
     
     Yields:
-        dict: The custom message.
+        bytes: The custom message as UTF-8 encoded JSON.
     """
     logger.info("Starting custom message generation.")
+    # The message never changes, so serialize and log it once up front
+    payload: bytes = orjson.dumps(custom_msg)
+    logger.debug("Generated custom message: {}", custom_msg)
     while True:
-        logger.debug(f"Generated custom message: {custom_msg}")
-        yield custom_msg
+        yield payload
 
 #####################################
 # Main Function
@@ -167,7 +204,8 @@ def main():
     verify_services()
 
     # Fetch configuration values from environment variables
-    topic = get_kafka_topic()
+    # kafka-python requires a str topic (not bytes), so intern it for reuse on every send
+    topic = sys.intern(get_kafka_topic())
     interval_secs = get_message_interval()
 
     # Decide which message generator to use
@@ -177,14 +215,20 @@ def main():
         message_generator = generate_custom_message(custom_msg)
     else:
         # Verify the data file exists
-        if not DATA_FILE.exists():
-            logger.error(f"Data file not found: {DATA_FILE}. Exiting.")
+        if not os.path.exists(DATA_FILE):
+            logger.error("Data file not found: {}. Exiting.", DATA_FILE)
             sys.exit(1)
         message_generator = generate_messages(DATA_FILE)
 
     # Create the Kafka producer
+    # Both generators yield JSON already serialized to bytes, so skip the serializer
+    # Let the client coalesce records into compressed batches
     producer = create_kafka_producer(
-        value_serializer=lambda x: json.dumps(x).encode("utf-8")
+        value_serializer=RAW_BYTES,
+        linger_ms=PRODUCER_LINGER_MS,
+        batch_size=PRODUCER_BATCH_SIZE,
+        compression_type=PRODUCER_COMPRESSION_TYPE,
+        acks=PRODUCER_ACKS,
     )
     if not producer:
         logger.error("Failed to create Kafka producer. Exiting...")
@@ -193,28 +237,45 @@ def main():
     # Create topic if it doesn't exist
     try:
         create_kafka_topic(topic)
-        logger.info(f"Kafka topic '{topic}' is ready.")
+        logger.info("Kafka topic '{}' is ready.", topic)
     except Exception as e:
-        logger.error(f"Failed to create or verify topic '{topic}': {e}")
+        logger.error("Failed to create or verify topic '{}': {}", topic, e)
         sys.exit(1)
 
     # Generate and send messages
-    logger.info(f"Starting message production to topic '{topic}'...")
+    logger.info("Starting message production to topic '{}'...", topic)
     try:
-        for message_dict in message_generator:
-            # Send message directly as a dictionary (producer handles serialization)
-            producer.send(topic, value=message_dict)
-            logger.info(f"Sent message to topic '{topic}': {message_dict}")
-            time.sleep(interval_secs)
+        # Pace sends against a monotonic deadline so send time does not add drift
+        next_deadline = time.monotonic()
+        for payload in message_generator:
+            # Send the pre-serialized bytes as-is
+            producer.send(topic, value=payload)
+            # Only decode the payload if the record is actually emitted
+            logger.opt(lazy=True).info(
+                "Sent message to topic '{}': {}", lambda: topic, lambda: payload.decode("utf-8")
+            )
+            # An interval of 0 means send as fast as the client allows
+            if interval_secs > 0:
+                next_deadline += interval_secs
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    # Fell behind (e.g. a blocking send); drop missed slots instead of bursting
+                    next_deadline = time.monotonic()
     except KeyboardInterrupt:
         logger.warning("Producer interrupted by user.")
     except Exception as e:
-        logger.error(f"Error during message production: {e}")
+        logger.error("Error during message production: {}", e)
     finally:
+        # Drain any batched records before closing
+        producer.flush()
         producer.close()
         logger.info("Kafka producer closed.")
 
     logger.info("END producer.")
+    # Wait for the background logging thread to write out queued records
+    logger.complete()
 
 
 #####################################
@@ -8,10 +8,13 @@ Logging is an essential way to track events and issues during execution.
 Features:
 - Logs information, warnings, and errors to a designated log file.
 - Ensures the log directory exists.
+- Optionally hands log records to a background writer thread (see
+  enable_queued_logging), so short bursts do not wait on sink I/O.
 """
 
 # Imports from Python Standard Library
 import pathlib
+import sys
 
 # Imports from external packages
 from loguru import logger
@@ -40,6 +43,25 @@ except Exception as e:
     logger.error(f"Error configuring logger to write to file: {e}")
 
 
+def enable_queued_logging(console_level: str = "INFO") -> None:
+    """
+    Replace the console and file sinks with queued (enqueue=True) versions.
+
+    Each record is pickled and put on a pipe-backed multiprocessing queue,
+    and a background thread writes it to the sinks. The pipe buffer absorbs
+    short bursts. Once it fills, log calls block until the sinks catch up,
+    so a sustained log rate above what the sinks can write still slows the
+    caller. Records are not dropped. Call logger.complete() before exiting
+    to wait for queued records.
+
+    Args:
+        console_level (str): Minimum level written to the console.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=console_level, enqueue=True)
+    logger.add(LOG_FILE, level="INFO", enqueue=True)
+
+
 def get_log_file_path() -> pathlib.Path:
     """Return the path to the log file."""
     return LOG_FILE
@@ -40,6 +40,9 @@ load_dotenv()
 DEFAULT_ZOOKEEPER_ADDRESS = "localhost:2181"
 DEFAULT_KAFKA_BROKER_ADDRESS = "localhost:9092"
 
+# Pass as value_serializer when message values are already bytes
+RAW_BYTES = object()
+
 #####################################
 # Helper Functions
 #####################################
@@ -124,20 +127,35 @@ def verify_services():
         sys.exit(2)
 
 
-def create_kafka_producer(value_serializer=None):
+def create_kafka_producer(
+    value_serializer=None,
+    linger_ms=0,
+    batch_size=16384,
+    compression_type=None,
+    acks=1,
+):
     """
     Create and return a Kafka producer instance.
 
     Args:
         value_serializer (callable): A custom serializer for message values.
                                      Defaults to UTF-8 string encoding.
+                                     Pass RAW_BYTES to send pre-serialized
+                                     bytes as-is, with no serializer.
+        linger_ms (int): Time to wait for more records before sending a batch.
+        batch_size (int): Maximum size in bytes of a per-partition batch.
+        compression_type (str): Batch compression codec (e.g. "gzip", "lz4").
+        acks (int | str): Acknowledgements required from the broker (0, 1, "all").
 
     Returns:
         KafkaProducer: Configured Kafka producer instance.
     """
     kafka_broker = get_kafka_broker_address()
 
-    if value_serializer is None:
+    if value_serializer is RAW_BYTES:
+        value_serializer = None  # Values are pre-serialized bytes
+
+    elif value_serializer is None:
 
         def value_serializer(x):
             return x.encode("utf-8")  # Default to string serialization
@@ -147,6 +165,10 @@ def create_kafka_producer(value_serializer=None):
         producer = KafkaProducer(
             bootstrap_servers=kafka_broker,
             value_serializer=value_serializer,
+            linger_ms=linger_ms,
+            batch_size=batch_size,
+            compression_type=compression_type,
+            acks=acks,
         )
         logger.info("Kafka producer successfully created.")
         return producer